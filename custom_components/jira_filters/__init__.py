@@ -1,93 +1,91 @@
 """The Jira Filters integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-import voluptuous as vol
-import homeassistant.helpers.config_validation as cv
+from dataclasses import dataclass
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import service
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.util import slugify
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-# This integration is config-entry only
-CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+PLATFORMS: Final = (Platform.SENSOR,)
 
 
-async def async_setup(hass: HomeAssistant, config: dict) -> bool:
-    """Set up the Jira Filters component."""
-    return True
+@dataclass(slots=True)
+class JiraEntryState:
+    """Runtime state kept for each Jira Filters config entry."""
+
+    coordinator: Any = None
+    refresh_task: asyncio.Task | None = None
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Jira Filters from a config entry."""
-    try:
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][entry.entry_id] = {
-            "data": entry.data,
-            "coordinator": None
-        }
-
-        # Forward the setup to the sensor platform.
-        try:
-            # Try newer API first
-            await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
-        except AttributeError:
-            # Fallback to older API
-            await hass.config_entries.async_forward_entry_setup(entry, "sensor")
-        
-        # Register services with connection name
-        connection_name = entry.data.get("name", "Jira")
-        service_name = f"refresh_{connection_name.lower().replace(' ', '_')}"
-        
-        async def handle_refresh_service(call: ServiceCall) -> None:
-            """Handle refresh service call."""
-            coordinator = hass.data[DOMAIN][entry.entry_id].get("coordinator")
-            if coordinator:
-                await coordinator.async_request_refresh()
-                _LOGGER.info("Manually refreshed Jira Filters data for %s", connection_name)
-            else:
-                _LOGGER.warning("No coordinator available for %s", connection_name)
-        
-        # Register the service
-        hass.services.async_register(
-            DOMAIN,
-            service_name,
-            handle_refresh_service,
-            schema=vol.Schema({}),
-        )
-        
-        _LOGGER.info("Registered service: %s.%s", DOMAIN, service_name)
-        return True
-    except Exception as err:
-        _LOGGER.error("Error setting up Jira Filters integration: %s", err)
-        return False
+    # Register services with connection name
+    connection_name = entry.data.get("name", "Jira")
+    service_name = f"refresh_{slugify(connection_name) or 'jira'}"
+    if hass.services.has_service(DOMAIN, service_name):
+        # Another entry already uses this connection name. Entry IDs are ULIDs,
+        # so take the random tail; the leading characters are a timestamp.
+        base_name = f"{service_name}_{entry.entry_id[-6:].lower()}"
+        service_name = base_name
+        counter = 2
+        while hass.services.has_service(DOMAIN, service_name):
+            service_name = f"{base_name}_{counter}"
+            counter += 1
+
+    state = JiraEntryState()
+    entry.runtime_data = state
+
+    async def handle_refresh_service(call: ServiceCall) -> None:
+        """Handle refresh service call."""
+        coordinator = state.coordinator
+        if not coordinator:
+            _LOGGER.warning("No coordinator available for %s", connection_name)
+            return
+
+        # Concurrent callers share the refresh that is already in flight.
+        # Shield it so a cancelled caller only stops its own wait.
+        if state.refresh_task is not None and not state.refresh_task.done():
+            await asyncio.shield(state.refresh_task)
+            return
+
+        state.refresh_task = hass.async_create_task(coordinator.async_request_refresh())
+        await asyncio.shield(state.refresh_task)
+        _LOGGER.info("Manually refreshed Jira Filters data for %s", connection_name)
+    
+    # Register the service
+    hass.services.async_register(
+        DOMAIN,
+        service_name,
+        handle_refresh_service,
+        schema=None,
+    )
+    _LOGGER.debug("Registered service: %s.%s", DOMAIN, service_name)
+
+    @callback
+    def _async_remove_service() -> None:
+        """Unregister the refresh service once the entry is unloaded."""
+        hass.services.async_remove(DOMAIN, service_name)
+        _LOGGER.debug("Unregistered service: %s.%s", DOMAIN, service_name)
+
+    entry.async_on_unload(_async_remove_service)
+
+    # Forward the setup to the sensor platform. This must come after the
+    # service is registered: entries are set up concurrently, and awaiting
+    # between the has_service check and async_register lets two entries
+    # with the same name claim the same service.
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    try:
-        # Try newer API first
-        unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
-    except AttributeError:
-        # Fallback to older API
-        unload_ok = await hass.config_entries.async_forward_entry_unload(entry, "sensor")
-    
-    if unload_ok:
-        # Unregister services
-        connection_name = entry.data.get("name", "Jira")
-        service_name = f"refresh_{connection_name.lower().replace(' ', '_')}"
-        
-        try:
-            hass.services.async_remove(DOMAIN, service_name)
-            _LOGGER.info("Unregistered service: %s.%s", DOMAIN, service_name)
-        except ValueError:
-            # Service might not exist, which is fine
-            pass
-        
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -1,38 +1,63 @@
 """Config flow for Jira Filters integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from functools import lru_cache
 from typing import Any
 
-_LOGGER = logging.getLogger(__name__)
-
-try:
-    import requests
-except ImportError:
-    _LOGGER.error("requests library is not available. Please ensure it's installed.")
-    raise
-
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN, MIN_REFRESH_MINUTES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Separate connect and read limits so an unreachable host fails fast
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(connect=5, sock_read=10)
+
+# aiohttp adds Content-Type itself for requests sent with json=
+_JSON_HEADERS = {'Accept': 'application/json'}
+
+# Successful filter validations, reused briefly while the user steps through the flow
+_FILTER_CACHE_TTL = 60
+_FILTER_CACHE: dict[tuple[str, str, int, str], tuple[float, str]] = {}
+
+
+def _request_options(
+    email: str, api_token: str, timeout: aiohttp.ClientTimeout = _DEFAULT_TIMEOUT
+) -> dict[str, Any]:
+    """Return the auth, headers and timeout sent with every Jira request."""
+    return {
+        'auth': aiohttp.BasicAuth(email, api_token),
+        'headers': _JSON_HEADERS,
+        'timeout': timeout,
+    }
+
+
+def _invalidate_filter_cache(base_url: str, filter_id: str | None = None) -> None:
+    """Forget cached filter validations for a Jira instance, or for a single filter."""
+    for key in [
+        k for k in _FILTER_CACHE
+        if k[0] == base_url and (filter_id is None or k[3] == filter_id)
+    ]:
+        del _FILTER_CACHE[key]
 
-from .const import DOMAIN
 
 def _extract_basename_from_url(url: str) -> str:
     """Extract basename from URL for default connection name."""
-    try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        hostname = parsed.hostname or ""
-        # Extract subdomain (e.g., "raptortech1" from "raptortech1.atlassian.net")
-        if "." in hostname:
-            return hostname.split(".")[0]
-        return hostname
-    except Exception:
-        return "Jira"
+    # Strip scheme, path, credentials and port to get the host
+    host = url.split("://", 1)[-1].split("/", 1)[0].rpartition("@")[2].split(":", 1)[0]
+    # Extract subdomain (e.g., "raptortech1" from "raptortech1.atlassian.net")
+    return host.partition(".")[0].lower() or "Jira"
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -41,7 +66,8 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required("api_token"): str,
         vol.Optional("name"): str,
         vol.Optional("max_results", default=100): int,
-        vol.Optional("refresh_minutes", default=5): int,
+        vol.Optional("refresh_minutes", default=5): vol.All(int, vol.Range(min=MIN_REFRESH_MINUTES)),
+        vol.Optional("filter_id"): str,
     }
 )
 
@@ -59,7 +85,7 @@ STEP_OPTIONS_SERVER_SCHEMA = vol.Schema(
         vol.Required("api_token"): str,
         vol.Optional("name"): str,
         vol.Optional("max_results", default=100): int,
-        vol.Optional("refresh_minutes", default=5): int,
+        vol.Optional("refresh_minutes", default=5): vol.All(int, vol.Range(min=MIN_REFRESH_MINUTES)),
     }
 )
 
@@ -70,6 +96,46 @@ STEP_OPTIONS_FILTER_SCHEMA = vol.Schema(
     }
 )
 
+STEP_ADD_MORE_SCHEMA = vol.Schema(
+    {
+        vol.Required("add_more", default=False): bool,
+    }
+)
+
+STEP_MANAGE_FILTERS_SCHEMA = vol.Schema(
+    {
+        vol.Required("action", default="add"): vol.In({
+            "add": "Add New Filter",
+            "edit": "Edit Existing Filter",
+            "remove": "Remove Filter"
+        })
+    }
+)
+
+STEP_NO_FILTERS_SCHEMA = vol.Schema({})
+
+def _build_server_schema(data: dict[str, Any]) -> vol.Schema:
+    """Return the server settings schema pre-filled with the current values."""
+    return vol.Schema({
+        vol.Required("base_url", default=data.get("base_url", "")): str,
+        vol.Required("email", default=data.get("email", "")): str,
+        vol.Required("api_token", default=data.get("api_token", "")): str,
+        vol.Optional("name", default=data.get("name", "")): str,
+        vol.Optional("max_results", default=data.get("max_results", 100)): int,
+        vol.Optional("refresh_minutes", default=data.get("refresh_minutes", 5)): vol.All(
+            int, vol.Range(min=MIN_REFRESH_MINUTES)
+        ),
+    })
+
+
+@lru_cache(maxsize=32)
+def _filter_details_schema(filter_id: str, filter_name: str) -> vol.Schema:
+    """Build the edit-filter schema pre-filled with a filter's current values."""
+    return vol.Schema({
+        vol.Required("filter_id", default=filter_id): str,
+        vol.Required("filter_name", default=filter_name): str,
+    })
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
@@ -82,42 +148,46 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     # Test connection to Jira API
     try:
-        response = await hass.async_add_executor_job(
-            _test_jira_connection, base_url, email, api_token
+        response = await _test_jira_connection(
+            async_get_clientsession(hass), base_url, email, api_token
         )
         if not response:
             raise CannotConnect
 
         return {"title": f"Jira ({base_url})"}
 
-    except requests.exceptions.RequestException as err:
+    except aiohttp.ClientError as err:
         _LOGGER.error("Error connecting to Jira: %s", err)
         raise CannotConnect from err
 
 
-def _test_jira_connection(base_url: str, email: str, api_token: str) -> bool:
+async def _test_jira_connection(
+    session: aiohttp.ClientSession, base_url: str, email: str, api_token: str
+) -> bool:
     """Test connection to Jira API."""
+    request_kwargs = _request_options(email, api_token)
     try:
-        session = requests.Session()
-        session.auth = (email, api_token)
-        session.headers.update({
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        })
-
-        # Test with a simple API call to get current user
-        response = session.get(
-            f"{base_url}/rest/api/3/myself",
-            timeout=30,
-            verify=True
-        )
-        response.raise_for_status()
-        
-        user_data = response.json()
-        _LOGGER.info("Successfully connected to Jira as: %s", user_data.get('displayName', email))
+        # Test with a simple API call to get current user. The profile itself
+        # is not needed, so HEAD is enough unless the server refuses it.
+        # aiohttp does not follow redirects for HEAD by default, and
+        # raise_for_status ignores 3xx, so only a 200 proves the credentials.
+        async with session.head(
+            f"{base_url}/rest/api/3/myself", allow_redirects=True, **request_kwargs
+        ) as response:
+            status = response.status
+
+        if status == 405:
+            async with session.get(f"{base_url}/rest/api/3/myself", **request_kwargs) as response:
+                status = response.status
+
+        if status != 200:
+            _LOGGER.error("Failed to connect to Jira: /myself returned status %s", status)
+            return False
+
+        _LOGGER.info("Successfully connected to Jira as: %s", email)
         return True
 
-    except requests.exceptions.RequestException as err:
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
         _LOGGER.error("Failed to connect to Jira: %s", err)
         return False
 
@@ -142,10 +212,25 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         errors = {}
+        user_input = dict(user_input)
+        filter_id = user_input.pop("filter_id", None)
 
         try:
-            info = await validate_input(self.hass, user_input)
-        except CannotConnect:
+            if filter_id:
+                # Check the credentials and the first filter in parallel
+                info, (filter_valid, jira_filter_name) = await asyncio.gather(
+                    validate_input(self.hass, user_input),
+                    _validate_filter(
+                        async_get_clientsession(self.hass),
+                        user_input["base_url"].rstrip("/"),
+                        user_input["email"],
+                        user_input["api_token"],
+                        filter_id,
+                    ),
+                )
+            else:
+                info = await validate_input(self.hass, user_input)
+        except (CannotConnect, aiohttp.ClientError, asyncio.TimeoutError):
             errors["base"] = "cannot_connect"
         except InvalidAuth:
             errors["base"] = "invalid_auth"
@@ -153,12 +238,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.exception("Unexpected exception")
             errors["base"] = "unknown"
         else:
-            # Set default name if not provided
-            if not user_input.get("name"):
-                user_input["name"] = _extract_basename_from_url(user_input["base_url"])
-            
-            self._data = user_input
-            return await self.async_step_filter()
+            if filter_id and not filter_valid:
+                errors["base"] = "invalid_filter"
+            else:
+                # Set default name if not provided
+                if not user_input.get("name"):
+                    user_input["name"] = _extract_basename_from_url(user_input["base_url"])
+                
+                self._data = user_input
+                if not filter_id:
+                    return await self.async_step_filter()
+
+                self._filters.append({
+                    "filter_id": filter_id,
+                    "filter_name": jira_filter_name
+                })
+                _LOGGER.info("Filter added successfully: %s", jira_filter_name)
+                return await self.async_step_add_more()
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
@@ -176,8 +272,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Validate filter exists and get filter name
         try:
             # First validate the filter exists
-            filter_valid, jira_filter_name = await self.hass.async_add_executor_job(
-                _validate_filter,
+            filter_valid, jira_filter_name = await _validate_filter(
+                async_get_clientsession(self.hass),
                 self._data["base_url"],
                 self._data["email"],
                 self._data["api_token"],
@@ -199,6 +295,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             _LOGGER.info("Filter added successfully: %s", filter_name)
             
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Could not reach Jira to validate filter: %s", err)
+            return self.async_show_form(
+                step_id="filter",
+                data_schema=STEP_FILTER_DATA_SCHEMA,
+                errors={"base": "cannot_connect"}
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception validating filter")
             return self.async_show_form(
@@ -217,9 +320,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is None:
             return self.async_show_form(
                 step_id="add_more",
-                data_schema=vol.Schema({
-                    vol.Required("add_more", default=False): bool
-                })
+                data_schema=STEP_ADD_MORE_SCHEMA
             )
 
         if user_input["add_more"]:
@@ -227,14 +328,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Create the entry with connection name in title
         title = f"Jira Filters - {self._data.get('name', 'Jira')}"
+        self._data["filters"] = self._filters
         
-        return self.async_create_entry(
-            title=title,
-            data={
-                **self._data,
-                "filters": self._filters
-            }
-        )
+        return self.async_create_entry(title=title, data=self._data)
 
     @staticmethod
     @callback
@@ -249,7 +345,45 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._data = dict(config_entry.data)
-        self._filters = list(config_entry.data.get("filters", []))
+        # Filter names indexed by filter ID; stored back as a list of dicts
+        self._filters: dict[str, str] = {
+            f["filter_id"]: f["filter_name"]
+            for f in config_entry.data.get("filters", [])
+        }
+        # Filter picker schemas by field name, valid until the filters change
+        self._filter_pickers: dict[str, vol.Schema] = {}
+
+    def _filter_picker_schema(self, field: str) -> vol.Schema:
+        """Return a schema for choosing one of the configured filters."""
+        schema = self._filter_pickers.get(field)
+        if schema is None:
+            filter_options = {
+                filter_id: f"{filter_name} (ID: {filter_id})"
+                for filter_id, filter_name in self._filters.items()
+            }
+            schema = self._filter_pickers[field] = vol.Schema({
+                vol.Required(field): vol.In(filter_options)
+            })
+        return schema
+
+    async def _persist_and_reload(self) -> None:
+        """Write the edited filters to the config entry and reload it."""
+        self._filter_pickers.clear()
+        self._data["filters"] = [
+            {"filter_id": filter_id, "filter_name": filter_name}
+            for filter_id, filter_name in self._filters.items()
+        ]
+        _LOGGER.info("Updating config entry with filters: %s", self._filters)
+
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data=self._data
+        )
+
+        try:
+            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.error("Error reloading integration: %s", e)
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -271,19 +405,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Handle server settings configuration."""
         if user_input is None:
-            # Create schema with current values as defaults
-            schema = vol.Schema({
-                vol.Required("base_url", default=self._data.get("base_url", "")): str,
-                vol.Required("email", default=self._data.get("email", "")): str,
-                vol.Required("api_token", default=self._data.get("api_token", "")): str,
-                vol.Optional("name", default=self._data.get("name", "")): str,
-                vol.Optional("max_results", default=self._data.get("max_results", 100)): int,
-                vol.Optional("refresh_minutes", default=self._data.get("refresh_minutes", 5)): int,
-            })
-            
             return self.async_show_form(
                 step_id="server_settings",
-                data_schema=schema,
+                data_schema=_build_server_schema(self._data),
                 description_placeholders={
                     "current_url": self._data.get("base_url", ""),
                     "current_email": self._data.get("email", "")
@@ -307,6 +431,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             if not user_input.get("name"):
                 user_input["name"] = _extract_basename_from_url(user_input["base_url"])
             
+            # Cached filter validations were made with the old credentials
+            _invalidate_filter_cache(self._data.get("base_url", ""))
+
             # Update the data with new settings
             self._data.update(user_input)
             
@@ -321,18 +448,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             
             return self.async_create_entry(title="", data={})
 
-        # Create schema with current values as defaults for error form
-        schema = vol.Schema({
-            vol.Required("base_url", default=self._data.get("base_url", "")): str,
-            vol.Required("email", default=self._data.get("email", "")): str,
-            vol.Required("api_token", default=self._data.get("api_token", "")): str,
-            vol.Optional("max_results", default=self._data.get("max_results", 100)): int,
-            vol.Optional("refresh_minutes", default=self._data.get("refresh_minutes", 5)): int,
-        })
-        
         return self.async_show_form(
             step_id="server_settings",
-            data_schema=schema,
+            data_schema=_build_server_schema(self._data),
             errors=errors,
             description_placeholders={
                 "current_url": self._data.get("base_url", ""),
@@ -347,19 +465,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is None:
             # Show current filters and options
             filter_list = "\n".join([
-                f"• {f['filter_name']} (ID: {f['filter_id']})"
-                for f in self._filters
+                f"• {filter_name} (ID: {filter_id})"
+                for filter_id, filter_name in self._filters.items()
             ]) if self._filters else "No filters configured"
             
             return self.async_show_form(
                 step_id="manage_filters",
-                data_schema=vol.Schema({
-                    vol.Required("action", default="add"): vol.In({
-                        "add": "Add New Filter",
-                        "edit": "Edit Existing Filter", 
-                        "remove": "Remove Filter"
-                    })
-                }),
+                data_schema=STEP_MANAGE_FILTERS_SCHEMA,
                 description_placeholders={
                     "current_filters": filter_list
                 }
@@ -382,11 +494,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 data_schema=STEP_OPTIONS_FILTER_SCHEMA
             )
 
+        if user_input["filter_id"] in self._filters:
+            return self.async_show_form(
+                step_id="add_filter",
+                data_schema=STEP_OPTIONS_FILTER_SCHEMA,
+                errors={"base": "duplicate_filter"}
+            )
+
         # Validate filter exists and get filter name
         try:
             # First validate the filter exists
-            filter_valid, jira_filter_name = await self.hass.async_add_executor_job(
-                _validate_filter,
+            filter_valid, jira_filter_name = await _validate_filter(
+                async_get_clientsession(self.hass),
                 self._data["base_url"],
                 self._data["email"],
                 self._data["api_token"],
@@ -401,13 +520,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             
             # Add filter to list - use provided name or Jira name
             filter_name = user_input.get("filter_name") or jira_filter_name
-            self._filters.append({
-                "filter_id": user_input["filter_id"],
-                "filter_name": filter_name
-            })
+            self._filters[user_input["filter_id"]] = filter_name
             
             _LOGGER.info("Filter added successfully: %s", filter_name)
             
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Could not reach Jira to validate filter: %s", err)
+            return self.async_show_form(
+                step_id="add_filter",
+                data_schema=STEP_OPTIONS_FILTER_SCHEMA,
+                errors={"base": "cannot_connect"}
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception validating filter")
             return self.async_show_form(
@@ -416,27 +539,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 errors={"base": "unknown"}
             )
 
-        # Update the config entry with new filters
-        self._data["filters"] = self._filters
-        _LOGGER.info("Updating config entry with filters: %s", self._filters)
-        
-        # Update the config entry data
-        self.hass.config_entries.async_update_entry(
-            self.config_entry,
-            data=self._data
-        )
-
-        # Force a reload by calling the unload and setup functions
-        _LOGGER.info("Forcing integration reload to apply filter changes")
-        try:
-            # Unload the current integration
-            await self.hass.config_entries.async_unload(self.config_entry.entry_id)
-            # Set it up again with the new data
-            await self.hass.config_entries.async_setup(self.config_entry.entry_id)
-        except Exception as e:
-            _LOGGER.error("Error reloading integration: %s", e)
-            # Fallback to the standard reload
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        await self._persist_and_reload()
 
         return self.async_create_entry(title="", data={})
 
@@ -447,7 +550,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if not self._filters:
             return self.async_show_form(
                 step_id="edit_filter",
-                data_schema=vol.Schema({}),
+                data_schema=STEP_NO_FILTERS_SCHEMA,
                 errors={"base": "no_filters"},
                 description_placeholders={
                     "message": "No filters configured. Please add a filter first."
@@ -456,22 +559,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             
         if user_input is None:
             # Show list of filters to edit
-            filter_options = {
-                f["filter_id"]: f"{f['filter_name']} (ID: {f['filter_id']})"
-                for f in self._filters
-            }
-            
             return self.async_show_form(
                 step_id="edit_filter",
-                data_schema=vol.Schema({
-                    vol.Required("filter_to_edit"): vol.In(filter_options)
-                })
+                data_schema=self._filter_picker_schema("filter_to_edit")
             )
 
         # Find the filter to edit
-        filter_to_edit = next(
-            f for f in self._filters if f["filter_id"] == user_input["filter_to_edit"]
-        )
+        filter_to_edit = {
+            "filter_id": user_input["filter_to_edit"],
+            "filter_name": self._filters[user_input["filter_to_edit"]],
+        }
         
         # Store the filter to edit in the flow data
         self._filter_to_edit = filter_to_edit
@@ -489,10 +586,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 
             return self.async_show_form(
                 step_id="edit_filter_details",
-                data_schema=vol.Schema({
-                    vol.Required("filter_id", default=filter_to_edit["filter_id"]): str,
-                    vol.Required("filter_name", default=filter_to_edit["filter_name"]): str,
-                })
+                data_schema=_filter_details_schema(
+                    filter_to_edit["filter_id"], filter_to_edit["filter_name"]
+                )
             )
 
         # Get the filter to edit
@@ -500,11 +596,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if not filter_to_edit:
             return self.async_abort(reason="no_filter_selected")
 
+        # Changing the ID to one that is already configured would merge two filters
+        if (
+            user_input["filter_id"] != filter_to_edit["filter_id"]
+            and user_input["filter_id"] in self._filters
+        ):
+            return self.async_show_form(
+                step_id="edit_filter_details",
+                data_schema=_filter_details_schema(
+                    filter_to_edit["filter_id"], filter_to_edit["filter_name"]
+                ),
+                errors={"base": "duplicate_filter"}
+            )
+
         # Validate filter exists and get filter name
         try:
             # First validate the filter exists
-            filter_valid, jira_filter_name = await self.hass.async_add_executor_job(
-                _validate_filter,
+            filter_valid, jira_filter_name = await _validate_filter(
+                async_get_clientsession(self.hass),
                 self._data["base_url"],
                 self._data["email"],
                 self._data["api_token"],
@@ -513,56 +622,47 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             if not filter_valid:
                 return self.async_show_form(
                     step_id="edit_filter_details",
-                    data_schema=vol.Schema({
-                        vol.Required("filter_id", default=filter_to_edit["filter_id"]): str,
-                        vol.Required("filter_name", default=filter_to_edit["filter_name"]): str,
-                    }),
+                    data_schema=_filter_details_schema(
+                        filter_to_edit["filter_id"], filter_to_edit["filter_name"]
+                    ),
                     errors={"base": "invalid_filter"}
                 )
             
             # Update the filter in the list - use provided name or Jira name
             filter_name = user_input.get("filter_name") or jira_filter_name
-            for i, filter_item in enumerate(self._filters):
-                if filter_item["filter_id"] == filter_to_edit["filter_id"]:
-                    self._filters[i] = {
-                        "filter_id": user_input["filter_id"],
-                        "filter_name": filter_name
-                    }
-                    break
+            old_filter_id = filter_to_edit["filter_id"]
+            if user_input["filter_id"] == old_filter_id:
+                self._filters[old_filter_id] = filter_name
+            else:
+                # Re-key in place so the filter keeps its position
+                self._filters = {
+                    (user_input["filter_id"] if fid == old_filter_id else fid):
+                        (filter_name if fid == old_filter_id else fname)
+                    for fid, fname in self._filters.items()
+                }
             
             _LOGGER.info("Filter updated successfully: %s", filter_name)
             
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Could not reach Jira to validate filter: %s", err)
+            return self.async_show_form(
+                step_id="edit_filter_details",
+                data_schema=_filter_details_schema(
+                    filter_to_edit["filter_id"], filter_to_edit["filter_name"]
+                ),
+                errors={"base": "cannot_connect"}
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception validating filter")
             return self.async_show_form(
                 step_id="edit_filter_details",
-                data_schema=vol.Schema({
-                    vol.Required("filter_id", default=filter_to_edit["filter_id"]): str,
-                    vol.Required("filter_name", default=filter_to_edit["filter_name"]): str,
-                }),
+                data_schema=_filter_details_schema(
+                    filter_to_edit["filter_id"], filter_to_edit["filter_name"]
+                ),
                 errors={"base": "unknown"}
             )
 
-        # Update the config entry
-        self._data["filters"] = self._filters
-        _LOGGER.info("Updating config entry with edited filters: %s", self._filters)
-        
-        self.hass.config_entries.async_update_entry(
-            self.config_entry,
-            data=self._data
-        )
-
-        # Force a reload by calling the unload and setup functions
-        _LOGGER.info("Forcing integration reload to apply filter edit changes")
-        try:
-            # Unload the current integration
-            await self.hass.config_entries.async_unload(self.config_entry.entry_id)
-            # Set it up again with the new data
-            await self.hass.config_entries.async_setup(self.config_entry.entry_id)
-        except Exception as e:
-            _LOGGER.error("Error reloading integration: %s", e)
-            # Fallback to the standard reload
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        await self._persist_and_reload()
 
         return self.async_create_entry(title="", data={})
 
@@ -573,7 +673,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if not self._filters:
             return self.async_show_form(
                 step_id="remove_filter",
-                data_schema=vol.Schema({}),
+                data_schema=STEP_NO_FILTERS_SCHEMA,
                 errors={"base": "no_filters"},
                 description_placeholders={
                     "message": "No filters configured. Please add a filter first."
@@ -582,165 +682,58 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             
         if user_input is None:
             # Show list of filters to remove
-            filter_options = {
-                f["filter_id"]: f"{f['filter_name']} (ID: {f['filter_id']})"
-                for f in self._filters
-            }
-            
             return self.async_show_form(
                 step_id="remove_filter",
-                data_schema=vol.Schema({
-                    vol.Required("filter_to_remove"): vol.In(filter_options)
-                })
+                data_schema=self._filter_picker_schema("filter_to_remove")
             )
 
         # Remove the filter
-        self._filters = [
-            f for f in self._filters if f["filter_id"] != user_input["filter_to_remove"]
-        ]
+        _invalidate_filter_cache(self._data["base_url"], user_input["filter_to_remove"])
+        del self._filters[user_input["filter_to_remove"]]
 
-        # Update the config entry
-        self._data["filters"] = self._filters
-        _LOGGER.info("Updating config entry with removed filters: %s", self._filters)
-        
-        self.hass.config_entries.async_update_entry(
-            self.config_entry,
-            data=self._data
-        )
-
-        # Force a reload by calling the unload and setup functions
-        _LOGGER.info("Forcing integration reload to apply filter removal changes")
-        try:
-            # Unload the current integration
-            await self.hass.config_entries.async_unload(self.config_entry.entry_id)
-            # Set it up again with the new data
-            await self.hass.config_entries.async_setup(self.config_entry.entry_id)
-        except Exception as e:
-            _LOGGER.error("Error reloading integration: %s", e)
-            # Fallback to the standard reload
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        await self._persist_and_reload()
 
         return self.async_create_entry(title="", data={})
 
 
-def _validate_filter(base_url: str, email: str, api_token: str, filter_id: str) -> tuple[bool, str]:
-    """Validate that a Jira filter exists and is accessible. Returns (is_valid, filter_name)."""
-    try:
-        session = requests.Session()
-        session.auth = (email, api_token)
-        session.headers.update({
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        })
+async def _validate_filter(
+    session: aiohttp.ClientSession, base_url: str, email: str, api_token: str, filter_id: str
+) -> tuple[bool, str]:
+    """Validate that a Jira filter exists and is accessible. Returns (is_valid, filter_name).
 
-        response = session.get(
-            f"{base_url}/rest/api/3/filter/{filter_id}",
-            timeout=30,
-            verify=True
-        )
+    Connection errors, timeouts and server errors are raised so callers can
+    tell an unreachable Jira apart from a missing filter.
+    """
+    cache_key = (base_url, email, hash(api_token), filter_id)
+    cached = _FILTER_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _FILTER_CACHE_TTL:
+        return True, cached[1]
+
+    # Filter search only returns id and name unless asked to expand,
+    # unlike /filter/{id} which always includes JQL, owner and sharing
+    async with session.get(
+        f"{base_url}/rest/api/3/filter/search",
+        params={'id': filter_id},
+        **_request_options(email, api_token),
+    ) as response:
+        if 400 <= response.status < 500:
+            # Not found or not visible to this user
+            return False, ""
         response.raise_for_status()
-        
-        # Extract filter name from response
-        filter_data = response.json()
-        filter_name = filter_data.get('name', f'Filter {filter_id}')
-        
-        return True, filter_name
-
-    except requests.exceptions.RequestException:
+        values = json_loads(await response.read()).get('values', [])
+    
+    # Extract filter name from response
+    filter_data = next(
+        (f for f in values if str(f.get('id')) == str(filter_id)),
+        None,
+    )
+    if filter_data is None:
         return False, ""
 
-
-def _test_filter_count(base_url: str, email: str, api_token: str, filter_id: str, max_results: int = 100) -> dict[str, Any]:
-    """Test a filter and return the count and basic info."""
-    try:
-        session = requests.Session()
-        session.auth = (email, api_token)
-        session.headers.update({
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        })
-
-        # Get filter details
-        filter_response = session.get(
-            f"{base_url}/rest/api/3/filter/{filter_id}",
-            timeout=30,
-            verify=True
-        )
-        filter_response.raise_for_status()
-        filter_data = filter_response.json()
-        
-        jql = filter_data.get("jql", "")
-        filter_name = filter_data.get("name", f"Filter {filter_id}")
-        
-        # Search for issues using the filter's JQL
-        search_payload = {
-            'jql': jql,
-            'maxResults': max_results,
-            'fields': ['summary', 'status', 'assignee', 'priority', 'issuetype', 'updated', 'created'],
-        }
-
-        # Try the new JQL endpoint first
-        try:
-            jql_response = session.post(
-                f"{base_url}/rest/api/3/search/jql",
-                json=search_payload,
-                timeout=30,
-                verify=True,
-            )
-            jql_response.raise_for_status()
-            search_response = jql_response
-        except requests.exceptions.HTTPError:
-            # Fall back to legacy endpoints
-            try:
-                post_response = session.post(
-                    f"{base_url}/rest/api/3/search",
-                    json=search_payload,
-                    timeout=30,
-                    verify=True,
-                )
-                post_response.raise_for_status()
-                search_response = post_response
-            except requests.exceptions.HTTPError:
-                get_response = session.get(
-                    f"{base_url}/rest/api/3/search",
-                    params={
-                        'jql': jql,
-                        'maxResults': max_results,
-                        'fields': 'summary,status,assignee,priority,issuetype,updated,created',
-                    },
-                    timeout=30,
-                    verify=True,
-                )
-                get_response.raise_for_status()
-                search_response = get_response
-        
-        search_data = search_response.json()
-        issues = search_data.get("issues", [])
-        
-        return {
-            "success": True,
-            "filter_name": filter_name,
-            "jql": jql,
-            "total_count": len(issues),
-            "max_results": max_results,
-            "sample_issues": [
-                {
-                    "key": issue.get("key"),
-                    "summary": issue.get("fields", {}).get("summary", ""),
-                    "status": issue.get("fields", {}).get("status", {}).get("name", ""),
-                }
-                for issue in issues[:5]  # Show first 5 issues as sample
-            ]
-        }
-
-    except requests.exceptions.RequestException as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "filter_name": f"Filter {filter_id}",
-            "jql": "",
-            "total_count": 0
-        }
+    filter_name = filter_data.get('name', f'Filter {filter_id}')
+    _FILTER_CACHE[cache_key] = (time.monotonic(), filter_name)
+    
+    return True, filter_name
 
 
 class CannotConnect(HomeAssistantError):
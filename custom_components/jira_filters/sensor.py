@@ -1,30 +1,33 @@
 """Sensor platform for Jira Filters integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
-_LOGGER = logging.getLogger(__name__)
-
-try:
-    import requests
-except ImportError:
-    _LOGGER.error("requests library is not available. Please ensure it's installed.")
-    raise
+import aiohttp
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
+    DEFAULT_REFRESH_MINUTES,
+    MIN_REFRESH_MINUTES,
     ATTR_FILTER_ID,
     ATTR_FILTER_NAME,
     ATTR_JQL,
@@ -42,6 +45,122 @@ from .const import (
     ATTR_ISSUE_CREATED,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_JSON_HEADERS = {'Accept': 'application/json'}
+
+# Responses worth retrying, and how hard to back off between attempts
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 1.0
+_RETRY_BACKOFF_CAP = 10.0
+_RETRY_JITTER = 0.5
+
+# Seconds a filter's JQL is reused before its details are fetched again
+_JQL_CACHE_TTL = 3600
+
+# Issue fields read by _simplify_issue, as a list and as a query string
+_JIRA_FIELDS = (
+    "summary",
+    "status",
+    "assignee",
+    "priority",
+    "issuetype",
+    "updated",
+    "created",
+    "parent",
+    "labels",
+)
+_JIRA_FIELDS_CSV = ",".join(_JIRA_FIELDS)
+
+# Search endpoints in the order they are probed, newest API first. Every call
+# here uses /rest/api/3, which only Jira Cloud serves, custom domains included.
+_SEARCH_ENDPOINTS = (
+    ("POST", "/rest/api/3/search/jql"),
+    ("POST", "/rest/api/3/search"),
+    ("GET", "/rest/api/3/search"),
+)
+# Statuses that send the probe on to the next endpoint, and that retire a cached one
+_SEARCH_FALLBACK_STATUSES = frozenset({400, 404, 405, 410})
+_ENDPOINT_GONE_STATUSES = frozenset({404, 410})
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float | None:
+    """Return seconds to wait before the next attempt, honouring Retry-After.
+
+    Returns None when the server asks for a longer wait than we are willing to
+    block a refresh for; the next scheduled poll retries instead.
+    """
+    if retry_after is not None and retry_after.isdigit():
+        delay = float(retry_after)
+        return delay if delay <= _RETRY_BACKOFF_CAP else None
+    backoff = min(_RETRY_BACKOFF_CAP, _RETRY_BACKOFF * 2 ** attempt)
+    return backoff * (1 + random.random() * _RETRY_JITTER)
+
+
+@lru_cache(maxsize=2048)
+def _parse_iso(timestamp_str: str) -> datetime:
+    """Parse a Jira ISO timestamp; the same issues come back on every refresh."""
+    return datetime.fromisoformat(timestamp_str)
+
+
+def _error_result(
+    filter_id: str, filter_name: str, now: datetime, error: str
+) -> dict[str, Any]:
+    """Return the result stored for a filter whose data could not be fetched."""
+    return {
+        'filter_id': filter_id,
+        'filter_name': filter_name,
+        'jql': '',
+        'total_count': 0,
+        'issues': [],
+        'most_recent_ticket': None,
+        'last_updated': now.isoformat(),
+        'error': error
+    }
+
+
+def _build_attributes(filter_data: dict[str, Any]) -> dict[str, Any]:
+    """Build a filter sensor's state attributes from its refresh result."""
+    attributes = {
+        ATTR_FILTER_ID: filter_data.get('filter_id'),
+        ATTR_FILTER_NAME: filter_data.get('filter_name'),
+        ATTR_JQL: filter_data.get('jql'),
+        ATTR_TOTAL_COUNT: filter_data.get('total_count', 0),
+        ATTR_MORE_ISSUES_AVAILABLE: filter_data.get('total_count', 0) > 10,
+        ATTR_LAST_UPDATED: filter_data.get('last_updated'),
+    }
+
+    # Add issues data (limited to avoid huge attributes)
+    issues = filter_data.get('issues', [])
+    if issues:
+        # Limit to first 10 issues to avoid huge attributes
+        attributes[ATTR_ISSUES] = [
+            {
+                ATTR_ISSUE_KEY: issue.get('key'),
+                ATTR_ISSUE_SUMMARY: issue.get('summary'),
+                ATTR_ISSUE_STATUS: issue.get('status', {}).get('name'),
+                ATTR_ISSUE_PRIORITY: issue.get('priority'),
+                ATTR_ISSUE_ASSIGNEE: issue.get('assignee', {}).get('displayName') if issue.get('assignee') else None,
+                ATTR_ISSUE_UPDATED: issue.get('updated'),
+                ATTR_ISSUE_CREATED: issue.get('created'),
+            }
+            for issue in islice(issues, 10)
+        ]
+
+    # Add most recent ticket info
+    most_recent = filter_data.get('most_recent_ticket')
+    if most_recent:
+        attributes[ATTR_MOST_RECENT_TICKET] = {
+            'key': most_recent.get('key'),
+            'summary': most_recent.get('summary'),
+            'updated': most_recent.get('updated'),
+            'updated_human': most_recent.get('updated_human')
+        }
+
+    return attributes
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -65,8 +184,9 @@ async def async_setup_entry(
 
         async_add_entities(entities)
         
-        # Store coordinator in hass data for dynamic updates
-        hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
+        # Store coordinator on the entry's runtime data for dynamic updates
+        config_entry.runtime_data.coordinator = coordinator
+        config_entry.async_on_unload(coordinator.async_shutdown)
         
         # Try to fetch initial data, but don't fail setup if it doesn't work
         try:
@@ -90,7 +210,15 @@ class JiraFiltersCoordinator(DataUpdateCoordinator):
         self.email = config_entry.data["email"]
         self.api_token = config_entry.data["api_token"]
         self.max_results = config_entry.data.get("max_results", 100)
-        self.refresh_minutes = config_entry.data.get("refresh_minutes", 5)
+        # Never poll faster than the minimum, whatever the stored value says
+        self.refresh_minutes = max(
+            MIN_REFRESH_MINUTES,
+            config_entry.data.get("refresh_minutes", DEFAULT_REFRESH_MINUTES),
+        )
+        self._session = async_get_clientsession(hass)
+        self._auth = aiohttp.BasicAuth(self.email, self.api_token)
+        self._search_endpoint: tuple[str, str] | None = None
+        self._jql_cache: dict[str, tuple[float, str]] = {}
 
         super().__init__(
             hass,
@@ -106,19 +234,26 @@ class JiraFiltersCoordinator(DataUpdateCoordinator):
         self.email = config_entry.data["email"]
         self.api_token = config_entry.data["api_token"]
         self.max_results = config_entry.data.get("max_results", 100)
-        self.refresh_minutes = config_entry.data.get("refresh_minutes", 5)
+        # Never poll faster than the minimum, whatever the stored value says
+        self.refresh_minutes = max(
+            MIN_REFRESH_MINUTES,
+            config_entry.data.get("refresh_minutes", DEFAULT_REFRESH_MINUTES),
+        )
+        self._auth = aiohttp.BasicAuth(self.email, self.api_token)
         
         # Update the refresh interval
         self.update_interval = timedelta(minutes=self.refresh_minutes)
+
+        # The server may have changed; detect its endpoints and filters again
+        self._search_endpoint = None
+        self._jql_cache.clear()
         
         _LOGGER.info("Updated coordinator configuration")
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         try:
-            return await self.hass.async_add_executor_job(
-                self._fetch_jira_data
-            )
+            return await self._fetch_jira_data()
         except Exception as err:
             # Provide more specific error messages for common issues
             error_msg = str(err)
@@ -131,152 +266,187 @@ class JiraFiltersCoordinator(DataUpdateCoordinator):
             else:
                 raise UpdateFailed(f"Error communicating with Jira API: {err}") from err
 
-    def _fetch_jira_data(self) -> dict[str, Any]:
-        """Fetch data from Jira API."""
+    async def _fetch_jira_data(self) -> dict[str, Any]:
+        """Fetch data from Jira API for all filters concurrently."""
+        # One timestamp for the whole refresh
+        now = datetime.now(timezone.utc)
+        results = await asyncio.gather(*(
+            self._fetch_one_filter(filter_config, now)
+            for filter_config in self.config_entry.data.get("filters", [])
+        ))
+
+        # Sensors read these on every state write, so build them once per refresh
+        for _filter_id, filter_data in results:
+            filter_data['_attributes'] = _build_attributes(filter_data)
+        return dict(results)
+
+    async def _fetch_one_filter(
+        self, filter_config: dict[str, Any], now: datetime
+    ) -> tuple[str, dict[str, Any]]:
+        """Fetch data for a single filter from Jira API."""
+        filter_id = filter_config["filter_id"]
+        filter_name = filter_config["filter_name"]
+
         try:
-            session = requests.Session()
-            session.auth = (self.email, self.api_token)
-            session.headers.update({
-                'Accept': 'application/json',
-                'Content-Type': 'application/json'
-            })
-
-            results = {}
-        except Exception as e:
-            _LOGGER.error("Failed to create requests session: %s", e)
-            raise
-        
-        for filter_config in self.config_entry.data.get("filters", []):
-            filter_id = filter_config["filter_id"]
-            filter_name = filter_config["filter_name"]
+            jql = await self._get_jql(filter_id)
+            if not jql:
+                # An empty query fails or matches every issue, so don't search
+                _LOGGER.warning("Filter %s has no JQL; skipping search", filter_id)
+                self._jql_cache.pop(filter_id, None)
+                return filter_id, _error_result(filter_id, filter_name, now, 'empty_jql')
             
-            try:
-                # Get filter details
-                filter_response = session.get(
-                    f"{self.base_url}/rest/api/3/filter/{filter_id}",
-                    timeout=30,
-                    verify=True
-                )
-                filter_response.raise_for_status()
-                filter_data = filter_response.json()
-                
-                jql = filter_data.get("jql", "")
-                
-                # Search for issues using the filter's JQL
-                search_payload = {
-                    'jql': jql,
-                    'maxResults': self.max_results,
-                    'fields': [
-                        'summary',
-                        'status',
-                        'assignee',
-                        'priority',
-                        'issuetype',
-                        'updated',
-                        'created',
-                        'parent',
-                        'labels',
-                        'project',
-                        'components',
-                        'issuelinks',
-                    ],
+            # Search for issues using the filter's JQL
+            search_data = await self._do_search(filter_id, jql)
+            
+            issues = search_data.get("issues", [])
+            simplified_issues = [self._simplify_issue(issue) for issue in issues]
+            
+            # Find most recent ticket
+            most_recent_ticket = None
+            if simplified_issues:
+                most_recent = max(simplified_issues, key=lambda x: x.get('updated') or '')
+                most_recent_ticket = {
+                    'key': most_recent.get('key'),
+                    'summary': most_recent.get('summary'),
+                    'updated': most_recent.get('updated'),
+                    'updated_human': self._format_human_time(most_recent.get('updated'), now) if most_recent.get('updated') else None
                 }
+            
+            filter_data = {
+                'filter_id': filter_id,
+                'filter_name': filter_name,
+                'jql': jql,
+                'total_count': len(simplified_issues),
+                'issues': simplified_issues,
+                'most_recent_ticket': most_recent_ticket,
+                'last_updated': now.isoformat()
+            }
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            _LOGGER.error("Error fetching data for filter %s: %s", filter_id, e)
+            # The filter may have been edited; fetch its JQL again next time
+            self._jql_cache.pop(filter_id, None)
+            return filter_id, _error_result(filter_id, filter_name, now, str(e))
 
-                # Prefer new Jira endpoint first to avoid 410 warnings
-                try:
-                    _LOGGER.debug("Using POST /rest/api/3/search/jql for filter %s", filter_id)
-                    jql_response = session.post(
-                        f"{self.base_url}/rest/api/3/search/jql",
-                        json=search_payload,
-                        timeout=30,
-                        verify=True,
-                    )
-                    jql_response.raise_for_status()
-                    search_response = jql_response
-                except requests.exceptions.HTTPError:
-                    jql_status = getattr(jql_response, 'status_code', None)
-                    # Fall back to legacy POST, then legacy GET only if needed
-                    _LOGGER.debug(
-                        "POST /rest/api/3/search/jql failed with status %s for filter %s; trying legacy endpoints",
-                        jql_status,
-                        filter_id,
-                    )
-                    try:
-                        post_response = session.post(
-                            f"{self.base_url}/rest/api/3/search",
-                            json=search_payload,
-                            timeout=30,
-                            verify=True,
-                        )
-                        post_response.raise_for_status()
-                        search_response = post_response
-                    except requests.exceptions.HTTPError:
-                        _LOGGER.debug(
-                            "POST /rest/api/3/search failed; trying GET /rest/api/3/search for filter %s",
-                            filter_id,
-                        )
-                        get_response = session.get(
-                            f"{self.base_url}/rest/api/3/search",
-                            params={
-                                'jql': jql,
-                                'maxResults': self.max_results,
-                                'fields': 'summary,status,assignee,priority,issuetype,updated,created,parent,labels,project,components,issuelinks',
-                            },
-                            timeout=30,
-                            verify=True,
-                        )
-                        get_response.raise_for_status()
-                        search_response = get_response
-                search_data = search_response.json()
-                
-                issues = search_data.get("issues", [])
-                simplified_issues = [self._simplify_issue(issue) for issue in issues]
-                
-                # Find most recent ticket
-                most_recent_ticket = None
-                if simplified_issues:
-                    sorted_issues = sorted(simplified_issues, key=lambda x: x.get('updated', ''), reverse=True)
-                    most_recent = sorted_issues[0]
-                    most_recent_ticket = {
-                        'key': most_recent.get('key'),
-                        'summary': most_recent.get('summary'),
-                        'updated': most_recent.get('updated'),
-                        'updated_human': self._format_human_time(most_recent.get('updated')) if most_recent.get('updated') else None
-                    }
-                
-                results[filter_id] = {
-                    'filter_id': filter_id,
-                    'filter_name': filter_name,
+        return filter_id, filter_data
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        fallback_statuses: frozenset[int] = frozenset(),
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request to Jira and return the decoded JSON body.
+
+        Rate limiting and transient server errors are retried with jittered
+        exponential backoff before the error is raised. A response whose status
+        is in fallback_statuses returns None instead of raising.
+        """
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            async with self._session.request(
+                method,
+                f"{self.base_url}{path}",
+                auth=self._auth,
+                headers=_JSON_HEADERS,
+                timeout=_REQUEST_TIMEOUT,
+                **kwargs,
+            ) as response:
+                if response.status in fallback_statuses:
+                    _LOGGER.debug("%s %s returned %s", method, path, response.status)
+                    return None
+                if response.status not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+                    response.raise_for_status()
+                    return json_loads(await response.read())
+                delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                if delay is None:
+                    response.raise_for_status()
+            _LOGGER.debug(
+                "%s %s returned %s; retrying in %.1f seconds",
+                method, path, response.status, delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def _get_jql(self, filter_id: str) -> str:
+        """Return the filter's JQL, fetching the filter details when the cache is stale."""
+        cached = self._jql_cache.get(filter_id)
+        if cached is not None and time.monotonic() - cached[0] < _JQL_CACHE_TTL:
+            return cached[1]
+
+        # Get filter details
+        filter_data = await self._request("GET", f"/rest/api/3/filter/{filter_id}")
+        jql = filter_data.get("jql", "")
+        self._jql_cache[filter_id] = (time.monotonic(), jql)
+        return jql
+
+    async def _search(
+        self,
+        endpoint: tuple[str, str],
+        jql: str,
+        fallback_statuses: frozenset[int] = frozenset(),
+    ) -> dict[str, Any] | None:
+        """Run a search against a single search endpoint."""
+        method, path = endpoint
+        if method == "GET":
+            return await self._request(
+                method,
+                path,
+                fallback_statuses,
+                params={
                     'jql': jql,
-                    'total_count': len(simplified_issues),
-                    'issues': simplified_issues,
-                    'most_recent_ticket': most_recent_ticket,
-                    'last_updated': datetime.now(timezone.utc).isoformat()
-                }
-                
-            except requests.exceptions.RequestException as e:
-                _LOGGER.error(f"Error fetching data for filter {filter_id}: {e}")
-                results[filter_id] = {
-                    'filter_id': filter_id,
-                    'filter_name': filter_name,
-                    'jql': '',
-                    'total_count': 0,
-                    'issues': [],
-                    'most_recent_ticket': None,
-                    'last_updated': datetime.now(timezone.utc).isoformat(),
-                    'error': str(e)
-                }
+                    'maxResults': self.max_results,
+                    'fields': _JIRA_FIELDS_CSV,
+                },
+            )
+        return await self._request(
+            method,
+            path,
+            fallback_statuses,
+            json={
+                'jql': jql,
+                'maxResults': self.max_results,
+                'fields': _JIRA_FIELDS,
+            },
+        )
+
+    async def _do_search(self, filter_id: str, jql: str) -> dict[str, Any]:
+        """Search using the endpoint that worked last, probing the others if needed."""
+        cached = self._search_endpoint
+        if cached is not None:
+            search_data = await self._search(cached, jql, _ENDPOINT_GONE_STATUSES)
+            if search_data is not None:
+                return search_data
+            _LOGGER.debug(
+                "%s %s is no longer available; probing search endpoints again",
+                *cached,
+            )
+            self._search_endpoint = None
 
-        return results
+        # Prefer new Jira endpoint first to avoid 410 warnings
+        for endpoint in _SEARCH_ENDPOINTS[:-1]:
+            _LOGGER.debug("Using %s %s for filter %s", *endpoint, filter_id)
+            search_data = await self._search(endpoint, jql, _SEARCH_FALLBACK_STATUSES)
+            if search_data is not None:
+                self._search_endpoint = endpoint
+                return search_data
+
+        # The last endpoint raises for any error status
+        endpoint = _SEARCH_ENDPOINTS[-1]
+        _LOGGER.debug("Using %s %s for filter %s", *endpoint, filter_id)
+        search_data = await self._search(endpoint, jql)
+        self._search_endpoint = endpoint
+        return search_data
 
     def _simplify_issue(self, issue: dict[str, Any]) -> dict[str, Any]:
         """Simplify Jira issue data for Home Assistant."""
-        fields = issue.get('fields', {})
+        fields = issue.get('fields') or {}
         status = fields.get('status') or {}
-        assignee = fields.get('assignee') or {}
-        priority = fields.get('priority') or {}
-        issue_type = fields.get('issuetype') or {}
-        parent = fields.get('parent') or {}
+        status_category = status.get('statusCategory')
+        assignee = fields.get('assignee')
+        priority = fields.get('priority')
+        issue_type = fields.get('issuetype')
+        parent = fields.get('parent')
+        parent_fields = parent.get('fields') if parent else None
 
         return {
             'id': issue.get('id'),
@@ -284,7 +454,7 @@ class JiraFiltersCoordinator(DataUpdateCoordinator):
             'summary': fields.get('summary'),
             'status': {
                 'name': status.get('name'),
-                'category': (status.get('statusCategory') or {}).get('name') if isinstance(status.get('statusCategory'), dict) else None
+                'category': status_category.get('name') if isinstance(status_category, dict) else None
             },
             'assignee': {
                 'accountId': assignee.get('accountId'),
@@ -296,19 +466,17 @@ class JiraFiltersCoordinator(DataUpdateCoordinator):
             'parent': {
                 'key': parent.get('key'),
                 'id': parent.get('id'),
-                'summary': (parent.get('fields') or {}).get('summary') if isinstance(parent.get('fields'), dict) else None
+                'summary': parent_fields.get('summary') if isinstance(parent_fields, dict) else None
             } if parent else None,
             'labels': fields.get('labels', []),
             'created': fields.get('created'),
             'updated': fields.get('updated')
         }
 
-    def _format_human_time(self, timestamp_str: str) -> str:
+    def _format_human_time(self, timestamp_str: str, now: datetime) -> str:
         """Convert ISO timestamp to human-readable relative time."""
         try:
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
-            diff = now - dt
+            diff = now - _parse_iso(timestamp_str)
             
             if diff.days > 0:
                 if diff.days == 1:
@@ -364,46 +532,7 @@ class JiraFilterSensor(CoordinatorEntity, SensorEntity):
         if not self.coordinator.data or self._filter_id not in self.coordinator.data:
             return {}
 
-        filter_data = self.coordinator.data[self._filter_id]
-        
-        attributes = {
-            ATTR_FILTER_ID: filter_data.get('filter_id'),
-            ATTR_FILTER_NAME: filter_data.get('filter_name'),
-            ATTR_JQL: filter_data.get('jql'),
-            ATTR_TOTAL_COUNT: filter_data.get('total_count', 0),
-            ATTR_MORE_ISSUES_AVAILABLE: filter_data.get('total_count', 0) > 10,
-            ATTR_LAST_UPDATED: filter_data.get('last_updated'),
-        }
-
-        # Add issues data (limited to avoid huge attributes)
-        issues = filter_data.get('issues', [])
-        if issues:
-            # Limit to first 10 issues to avoid huge attributes
-            limited_issues = issues[:10]
-            attributes[ATTR_ISSUES] = [
-                {
-                    ATTR_ISSUE_KEY: issue.get('key'),
-                    ATTR_ISSUE_SUMMARY: issue.get('summary'),
-                    ATTR_ISSUE_STATUS: issue.get('status', {}).get('name'),
-                    ATTR_ISSUE_PRIORITY: issue.get('priority'),
-                    ATTR_ISSUE_ASSIGNEE: issue.get('assignee', {}).get('displayName') if issue.get('assignee') else None,
-                    ATTR_ISSUE_UPDATED: issue.get('updated'),
-                    ATTR_ISSUE_CREATED: issue.get('created'),
-                }
-                for issue in limited_issues
-            ]
-
-        # Add most recent ticket info
-        most_recent = filter_data.get('most_recent_ticket')
-        if most_recent:
-            attributes[ATTR_MOST_RECENT_TICKET] = {
-                'key': most_recent.get('key'),
-                'summary': most_recent.get('summary'),
-                'updated': most_recent.get('updated'),
-                'updated_human': most_recent.get('updated_human')
-            }
-
-        return attributes
+        return self.coordinator.data[self._filter_id].get('_attributes', {})
 
     @property
     def icon(self) -> str: